@@ -0,0 +1,72 @@
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
+import asyncio
+import database
+import rate_limit
+import compression
+import scheduler
+from routers import auth, categories, transactions, recurring, stats, health
+
+# Şema yönetimi migrations/ altındaki Alembic migration'larıyla yapılır:
+#   alembic upgrade head   (her deploy'da bir kez)
+
+WARM_UP_RETRY_SECONDS = 5
+
+async def warm_up(app: FastAPI):
+    """Bağlantı havuzunu arka planda ısıt; başarılı olunca /ready 200 döner"""
+    while True:
+        try:
+            await asyncio.to_thread(database.warm_pool)
+            app.state.ready = True
+            return
+        except Exception as e:
+            print(f"Veritabanı bağlantı hatası: {e}")
+            await asyncio.sleep(WARM_UP_RETRY_SECONDS)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Worker istek kabul etmeye hemen başlar; havuz arka planda ısınır
+    app.state.ready = False
+    tasks = [asyncio.create_task(warm_up(app))]
+    # Tekrarlayan işlemleri oluşturan arka plan görevi
+    if scheduler.RECURRING_SCHEDULER_ENABLED:
+        tasks.append(asyncio.create_task(scheduler.run_forever()))
+    yield
+    for task in tasks:
+        task.cancel()
+
+def create_app() -> FastAPI:
+    app = FastAPI(title="Mangır API", version="1.0.0", lifespan=lifespan)
+    app.state.ready = False
+
+    # Auth uçları için hız sınırı (DB ve bcrypt'ten önce çalışır)
+    if rate_limit.RATE_LIMIT_ENABLED:
+        app.add_middleware(rate_limit.RateLimitMiddleware)
+
+    # Yanıt sıkıştırma (brotli/gzip)
+    app.add_middleware(compression.CompressionMiddleware)
+
+    # CORS (Flutter'dan erişim için)
+    origins = [
+        "http://localhost",
+        "http://localhost:8000",
+        "http://127.0.0.1:8000",
+    ]
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    app.include_router(health.router)
+    app.include_router(auth.router)
+    app.include_router(categories.router)
+    app.include_router(transactions.router)
+    app.include_router(recurring.router)
+    app.include_router(stats.router)
+
+    return app
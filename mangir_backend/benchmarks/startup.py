@@ -0,0 +1,69 @@
+"""Worker başlangıç süresi ölçümü.
+
+Her ölçüm yeni bir Python sürecinde yapılır (soğuk başlangıç):
+  - import: main modülünün import edilip uygulamanın oluşturulması
+  - create_all: eski başlangıçta import sırasında yapılan şema yansıtması
+  - ready: lifespan başladıktan sonra /ready'nin 200 dönmesine kadar geçen süre
+
+Varsayılan olarak geçici bir SQLite veritabanı kullanılır; gerçek sunucuyu
+ölçmek için DATABASE_URL verin:
+
+    cd mangir_backend
+    python benchmarks/startup.py
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 5
+
+PROBE = r"""
+import time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+
+import models
+from database import engine
+models.Base.metadata.create_all(bind=engine)
+created = time.perf_counter()
+engine.dispose()
+
+from fastapi.testclient import TestClient
+with TestClient(main.app) as client:
+    lifespan_started = time.perf_counter()
+    while client.get("/ready").status_code != 200:
+        time.sleep(0.001)
+    ready = time.perf_counter()
+
+print(imported - started, created - imported, ready - lifespan_started)
+"""
+
+
+def run():
+    env = dict(os.environ)
+    if "DATABASE_URL" not in env:
+        env["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'startup.db')}"
+    env.setdefault("SECRET_KEY", "bench")
+    env.setdefault("ALGORITHM", "HS256")
+    env.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+    env["RECURRING_SCHEDULER_ENABLED"] = "false"
+
+    samples = []
+    for _ in range(RUNS):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE],
+            cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True
+        ).stdout.split()
+        samples.append([float(value) * 1000 for value in output])
+
+    print(f"{RUNS} soğuk başlangıç (medyan, ms)")
+    for name, values in zip(("import", "create_all", "ready"), zip(*samples)):
+        print(f"{name:<12} {statistics.median(values):>8.2f}")
+
+
+if __name__ == "__main__":
+    run()
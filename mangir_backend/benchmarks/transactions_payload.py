@@ -0,0 +1,89 @@
+"""GET /api/transactions yanıt boyutu ve gecikme karşılaştırması.
+
+Geçici bir SQLite veritabanında çalışır; gerçek veritabanına dokunmaz.
+
+    cd mangir_backend
+    python benchmarks/transactions_payload.py
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# Uygulama import edilmeden önce geçici veritabanı ayarlanır
+DB_PATH = os.path.join(tempfile.mkdtemp(), "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+os.environ.setdefault("SECRET_KEY", "bench")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+os.environ["RECURRING_SCHEDULER_ENABLED"] = "false"
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+
+import main
+import models
+from database import SessionLocal, engine
+
+ROWS = 1000
+REPEAT = 20
+
+CASES = [
+    ("tam (varsayılan)", "", "identity"),
+    ("tam + gzip", "", "gzip"),
+    ("tam + br", "", "br"),
+    ("category=id", "&category=id", "identity"),
+    ("category=id + br", "&category=id", "br"),
+    ("fields=id,amount,transaction_date&category=id + br", "&fields=id,amount,transaction_date&category=id", "br"),
+]
+
+
+def seed(client: TestClient) -> dict:
+    # Geçici veritabanı; migration yerine doğrudan şemadan oluşturulur
+    models.Base.metadata.create_all(bind=engine)
+    client.post("/api/categories/seed")
+    client.post("/api/auth/register", json={"email": "bench@mangir.app", "full_name": "Bench", "password": "bench"})
+    token = client.post("/api/auth/login", data={"username": "bench@mangir.app", "password": "bench"}).json()["access_token"]
+
+    db = SessionLocal()
+    start = datetime(2024, 1, 1)
+    db.add_all([
+        models.Transaction(
+            user_id=1,
+            category_id=i % 10 + 1,
+            amount=round(10 + i * 1.37 % 500, 2),
+            description=f"İşlem açıklaması {i}",
+            transaction_date=start + timedelta(hours=i)
+        )
+        for i in range(ROWS)
+    ])
+    db.commit()
+    db.close()
+    return {"Authorization": f"Bearer {token}"}
+
+
+def run():
+    client = TestClient(main.app)
+    headers = seed(client)
+
+    print(f"{ROWS} işlem, {REPEAT} tekrar")
+    print(f"{'durum':<55} {'bayt':>9} {'ms':>8}")
+    for name, params, encoding in CASES:
+        request_headers = {**headers, "Accept-Encoding": encoding}
+        url = f"/api/transactions?limit={ROWS}{params}"
+        client.get(url, headers=request_headers)
+
+        started = time.perf_counter()
+        for _ in range(REPEAT):
+            response = client.get(url, headers=request_headers)
+        elapsed = (time.perf_counter() - started) / REPEAT * 1000
+
+        # httpx gövdeyi açar; ağdaki boyut Content-Length başlığıdır
+        size = int(response.headers.get("content-length", len(response.content)))
+        print(f"{name:<55} {size:>9} {elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    run()
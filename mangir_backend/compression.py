@@ -0,0 +1,124 @@
+"""Accept-Encoding'e göre brotli/gzip yanıt sıkıştırma (ASGI middleware).
+
+Eşik değerinden küçük yanıtlar sıkıştırılmaz. brotli paketi kurulu değilse
+yalnızca gzip kullanılır.
+"""
+import os
+import zlib
+
+from dotenv import load_dotenv
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+load_dotenv()
+
+COMPRESSION_MINIMUM_SIZE = int(os.getenv("COMPRESSION_MINIMUM_SIZE", 1024))
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4  # Dinamik yanıtlar için hız/oran dengesi
+
+
+def negotiate_encoding(accept_encoding: str):
+    """İstemcinin en yüksek q ile kabul ettiği kodlamayı seç; eşitlikte br > gzip"""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    # "*" listelenmeyen kodlamaları kapsar
+    wildcard = accepted.get("*", 0.0)
+    candidates = ["br", "gzip"] if brotli is not None else ["gzip"]
+    best, best_quality = None, 0.0
+    for encoding in candidates:
+        quality = accepted.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class _Compressor:
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+            self.compress = compressor.process
+            self.finish = compressor.finish
+        else:
+            # wbits=31: gzip başlığı ve sağlama toplamı
+            compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+            self.compress = compressor.compress
+            self.finish = compressor.flush
+
+
+class CompressionMiddleware:
+    def __init__(self, app, minimum_size: int = COMPRESSION_MINIMUM_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            return await self.app(scope, receive, send)
+
+        initial_message = {}
+        started = False
+        passthrough = False
+        compressor = None
+
+        async def send_compressed(message):
+            nonlocal initial_message, started, passthrough, compressor
+
+            if message["type"] == "http.response.start":
+                # Başlıklar, gövdenin boyutu görülene kadar bekletilir
+                initial_message = message
+                passthrough = "content-encoding" in Headers(raw=message["headers"])
+                return
+
+            if message["type"] != "http.response.body":
+                return await send(message)
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if not started:
+                started = True
+                if passthrough or (len(body) < self.minimum_size and not more_body):
+                    passthrough = True
+                    await send(initial_message)
+                    return await send(message)
+
+                compressor = _Compressor(encoding)
+                headers = MutableHeaders(raw=initial_message["headers"])
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if more_body:
+                    del headers["Content-Length"]
+                    message["body"] = compressor.compress(body)
+                else:
+                    message["body"] = compressor.compress(body) + compressor.finish()
+                    headers["Content-Length"] = str(len(message["body"]))
+                await send(initial_message)
+                return await send(message)
+
+            if passthrough:
+                return await send(message)
+
+            # Akış halindeki yanıtın devamı
+            message["body"] = compressor.compress(body)
+            if not more_body:
+                message["body"] += compressor.finish()
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
@@ -7,8 +7,15 @@ from dotenv import load_dotenv
 load_dotenv()
 
 SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+# create_engine bağlantı açmaz; ilk bağlantı ilk sorguda veya warm_pool'da açılır
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    pool_pre_ping=True,
+    pool_recycle=3600
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -18,4 +25,16 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+def warm_pool(size: int = DB_POOL_SIZE):
+    """Havuzdaki bağlantıları önceden aç (ilk isteklerin bağlantı beklememesi için)"""
+    connections = []
+    try:
+        for _ in range(size):
+            connection = engine.connect()
+            connection.exec_driver_sql("SELECT 1")
+            connections.append(connection)
+    finally:
+        for connection in connections:
+            connection.close()
@@ -0,0 +1,241 @@
+"""Analiz ekibi için işlemleri Parquet dosyalarına aktaran komut satırı aracı.
+
+İşlemler kategorilerle birleştirilip sunucu taraflı cursor ile parça parça okunur
+ve yıl/ay bölümlü Parquet dosyalarına yazılır:
+
+    exports/year=2025/month=01/part-000000001201-000000004388.parquet
+
+Dosya adı, dosyadaki en küçük ve en büyük işlem id'sidir; çalıştırmalar birbirinin
+dosyasının üzerine yazmaz.
+
+Varsayılan mod artımlıdır: yalnızca son çalıştırmadan sonra eklenen işlemler
+(id'si kayıtlı en büyük id'den büyük olanlar) aktarılır. Eşzamanlı yazmalarda
+düşük id'li bir satır yüksek id'li bir satırdan sonra commit edilebildiği için
+son EXPORT_LAG_SECONDS (varsayılan 600 sn) içinde oluşturulan işlemler ve
+onlardan büyük id'ler bir sonraki çalıştırmaya bırakılır. Bu süreden uzun açık
+kalan veritabanı işlemleri veya replika gecikmesi yine de satır kaçırabilir;
+gecikme payı bunlardan büyük seçilmelidir. Güncellenen veya silinen
+işlemler artımlı modda yansımaz; bunun için --full ile yeniden aktarın. Tam aktarım
+önce .staging-* dizinine yazılır; mevcut bölümler ve durum ancak aktarım başarıyla
+biterse değiştirilir.
+
+Canlı veritabanını yormamak için ANALYTICS_DATABASE_URL ile bir replika
+verilebilir; verilmezse DATABASE_URL kullanılır.
+
+    python export_parquet.py --output exports
+    python export_parquet.py --output exports --full
+"""
+import argparse
+import json
+import os
+import shutil
+import uuid
+from datetime import datetime, timedelta
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, func, select
+
+import models
+
+load_dotenv()
+
+ANALYTICS_DATABASE_URL = os.getenv("ANALYTICS_DATABASE_URL") or os.getenv("DATABASE_URL")
+# Bu süreden yeni işlemler bir sonraki çalıştırmaya bırakılır (uzun veritabanı
+# işlemleri ve replika gecikmesi için pay)
+EXPORT_LAG_SECONDS = int(os.getenv("EXPORT_LAG_SECONDS", 600))
+STATE_FILE = "_export_state.json"
+
+SCHEMA = pa.schema([
+    ("id", pa.int64()),
+    ("user_id", pa.int64()),
+    ("category_id", pa.int64()),
+    ("category_name", pa.string()),
+    ("category_type", pa.string()),
+    ("amount", pa.float64()),
+    ("description", pa.string()),
+    ("transaction_date", pa.timestamp("us")),
+    ("created_at", pa.timestamp("us")),
+])
+
+
+def _load_state(output_dir: str) -> dict:
+    path = os.path.join(output_dir, STATE_FILE)
+    if not os.path.exists(path):
+        return {"last_id": 0}
+    with open(path) as f:
+        return json.load(f)
+
+
+def _save_state(output_dir: str, state: dict):
+    """Durum dosyasını atomik olarak yaz"""
+    path = os.path.join(output_dir, STATE_FILE)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)
+
+
+def _partitions(directory: str):
+    return [name for name in os.listdir(directory) if name.startswith("year=")]
+
+
+def _swap_in_staging(output_dir: str, staging_dir: str, run_id: str):
+    """Tam aktarımın bölümlerini yerine koy; eski bölümler en son silinir"""
+    trash_dir = os.path.join(output_dir, f".old-{run_id}")
+    os.makedirs(trash_dir)
+    for name in _partitions(output_dir):
+        os.replace(os.path.join(output_dir, name), os.path.join(trash_dir, name))
+    for name in _partitions(staging_dir):
+        os.replace(os.path.join(staging_dir, name), os.path.join(output_dir, name))
+    return trash_dir
+
+
+def _publish(tmp_path: str, final_path: str):
+    """Geçici dosyayı yerine koy; var olan bir dosyanın üzerine asla yazmaz.
+
+    Aynı ad, aynı bölümde aynı id aralığı demektir: önceki bir çalıştırma dosyayı
+    yazıp durumu kaydedemeden durmuştur. Bu durumda yeni kopya atılır.
+    """
+    try:
+        # os.link hedef varsa FileExistsError verir (os.replace ise sessizce ezerdi)
+        os.link(tmp_path, final_path)
+    except FileExistsError:
+        pass
+    os.remove(tmp_path)
+
+
+def _to_table(rows) -> pa.Table:
+    """Bir parça satırı sütunlara çevir"""
+    columns = list(zip(*rows))
+    # Enum -> str
+    columns[4] = [t.value for t in columns[4]]
+    return pa.Table.from_arrays(
+        [pa.array(column, type=field.type) for column, field in zip(columns, SCHEMA)],
+        schema=SCHEMA
+    )
+
+
+def export(output_dir: str, full: bool = False, chunk_size: int = 50000, database_url: str = ANALYTICS_DATABASE_URL, lag_seconds: int = EXPORT_LAG_SECONDS) -> int:
+    """İşlemleri Parquet'e aktar; aktarılan satır sayısını döner"""
+    os.makedirs(output_dir, exist_ok=True)
+
+    run_id = f"{datetime.utcnow():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+
+    # Tam aktarım ayrı bir dizine yazılır; mevcut veri ve durum ancak başarıyla
+    # biterse değiştirilir
+    if full:
+        state = {"last_id": 0}
+        target_dir = os.path.join(output_dir, f".staging-{run_id}")
+        os.makedirs(target_dir)
+    else:
+        state = _load_state(output_dir)
+        target_dir = output_dir
+
+    engine = create_engine(database_url)
+
+    # Üst sınır: created_at'i gecikme payından yeni olan ilk işlemin id'si. Bu id'nin
+    # altındakiler yerleşmiş kabul edilir; daha düşük id ile geç commit edilen bir
+    # satır, üst sınır onu geçmeden önce görünür olur
+    cutoff = datetime.utcnow() - timedelta(seconds=lag_seconds)
+    conditions = [models.Transaction.id > state["last_id"]]
+    with engine.connect() as conn:
+        upper_id = conn.execute(
+            select(func.min(models.Transaction.id)).where(
+                models.Transaction.id > state["last_id"],
+                models.Transaction.created_at > cutoff
+            )
+        ).scalar()
+    if upper_id is not None:
+        conditions.append(models.Transaction.id < upper_id)
+
+    query = select(
+        models.Transaction.id,
+        models.Transaction.user_id,
+        models.Transaction.category_id,
+        models.Category.name,
+        models.Category.type,
+        models.Transaction.amount,
+        models.Transaction.description,
+        models.Transaction.transaction_date,
+        models.Transaction.created_at
+    ).join(
+        models.Category
+    ).where(
+        *conditions
+    ).order_by(
+        models.Transaction.id
+    )
+
+    # Her yıl/ay bölümü için tek dosya; parçalar row group olarak eklenir
+    writers = {}
+    paths = {}
+    id_ranges = {}
+    exported = 0
+    last_id = state["last_id"]
+    try:
+        with engine.connect() as conn:
+            # stream_results: pymysql'de sunucu taraflı cursor (SSCursor) kullanılır
+            result = conn.execution_options(stream_results=True, yield_per=chunk_size).execute(query)
+            for rows in result.partitions():
+                table = _to_table(rows)
+                dates = table.column("transaction_date")
+                partition_keys = pc.add(pc.multiply(pc.year(dates), 100), pc.month(dates))
+
+                for key in pc.unique(partition_keys).to_pylist():
+                    year, month = divmod(key, 100)
+                    part = table.filter(pc.equal(partition_keys, key))
+                    ids = part.column("id")
+                    if key not in writers:
+                        partition_dir = os.path.join(target_dir, f"year={year}", f"month={month:02d}")
+                        os.makedirs(partition_dir, exist_ok=True)
+                        # Yarım kalan çalıştırmalar okuyuculara görünmesin
+                        paths[key] = os.path.join(partition_dir, f".part-{run_id}.parquet.tmp")
+                        writers[key] = pq.ParquetWriter(paths[key], SCHEMA, compression="zstd")
+                        id_ranges[key] = [ids[0].as_py(), None]
+                    id_ranges[key][1] = ids[-1].as_py()
+                    writers[key].write_table(part)
+
+                exported += table.num_rows
+                last_id = rows[-1].id
+        for writer in writers.values():
+            writer.close()
+        for key, (first_id, last_id_in_part) in id_ranges.items():
+            final_path = os.path.join(
+                os.path.dirname(paths[key]), f"part-{first_id:012d}-{last_id_in_part:012d}.parquet"
+            )
+            _publish(paths[key], final_path)
+    except BaseException:
+        for key, writer in writers.items():
+            writer.close()
+            if os.path.exists(paths[key]):
+                os.remove(paths[key])
+        if full:
+            shutil.rmtree(target_dir)
+        raise
+    finally:
+        engine.dispose()
+
+    # Durum yalnızca tüm dosyalar yerine konduktan sonra ilerletilir
+    if full:
+        trash_dir = _swap_in_staging(output_dir, target_dir, run_id)
+        _save_state(output_dir, {"last_id": last_id, "last_run": run_id})
+        shutil.rmtree(trash_dir)
+        os.rmdir(target_dir)
+    elif exported:
+        _save_state(output_dir, {"last_id": last_id, "last_run": run_id})
+    return exported
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="İşlemleri yıl/ay bölümlü Parquet dosyalarına aktar")
+    parser.add_argument("--output", default="exports", help="Çıktı dizini")
+    parser.add_argument("--full", action="store_true", help="Tüm işlemleri yeniden aktar; önceki bölümler yalnızca başarıyla bitince değiştirilir")
+    parser.add_argument("--chunk-size", type=int, default=50000, help="Her parçada okunacak satır sayısı")
+    parser.add_argument("--lag-seconds", type=int, default=EXPORT_LAG_SECONDS, help="Bu süreden yeni işlemleri sonraki çalıştırmaya bırak")
+    args = parser.parse_args()
+
+    count = export(args.output, full=args.full, chunk_size=args.chunk_size, lag_seconds=args.lag_seconds)
+    print(f"Aktarılan işlem sayısı: {count}")
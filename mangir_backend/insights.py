@@ -0,0 +1,235 @@
+"""Kullanıcı harcama analizleri (NumPy ile vektörel hesaplama).
+
+Kullanıcının tüm geçmişi tek sorguyla aylık sütun dizilerine yüklenir; aylık toplamlar,
+hareketli ortalamalar, aylık değişimler, kategori bazlı anomaliler (bu ayın ilk
+günleri geçmiş ayların aynı günleriyle karşılaştırılır) ve ay sonu tahmini satır
+döngüsü olmadan hesaplanır. Sonuçlar kullanıcının bir sonraki
+yazma işlemine kadar bellekte tutulur.
+"""
+import calendar
+import time
+from datetime import date
+
+import numpy as np
+from sqlalchemy import String, case, cast, func
+from sqlalchemy.orm import Session
+
+import insights_cache
+import models
+
+ANOMALY_Z_THRESHOLD = 2.0
+# Bir kategori, en az bu kadar geçmiş ayı olmadan anomali olarak işaretlenmez
+ANOMALY_MIN_HISTORY_MONTHS = 3
+
+def _load_columns(db: Session, user_id: int, day: int):
+    """Kullanıcının geçmişini tek sorguda (ay, kategori, toplam, ilk `day` gündeki toplam)
+    sütun dizileri olarak yükle.
+
+    Toplama veritabanında yapılır; çok yıllık geçmişler bile en fazla
+    ay sayısı x kategori sayısı kadar satır döndürür.
+    """
+    # Ay, tarihin metin halinin ilk 7 karakteri (YYYY-MM); satır başına
+    # EXTRACT/STRFTIME çağırmaktan belirgin şekilde ucuz. Gün de aynı şekilde 9-10. karakterler
+    date_text = cast(models.Transaction.transaction_date, String)
+    month_key = func.substr(date_text, 1, 7).label('month_key')
+    to_date_amount = case(
+        (func.substr(date_text, 9, 2) <= f"{day:02d}", models.Transaction.amount),
+        else_=0
+    )
+
+    rows = db.query(
+        month_key,
+        models.Transaction.category_id,
+        func.sum(models.Transaction.amount),
+        func.sum(to_date_amount)
+    ).filter(
+        models.Transaction.user_id == user_id
+    ).group_by(
+        'month_key',
+        models.Transaction.category_id
+    ).all()
+
+    if not rows:
+        return None
+
+    # Kategori kataloğu küçük; gider kategorileri ayrı sorguyla alınır
+    expense_category_ids = [
+        c.id for c in db.query(models.Category.id).filter(
+            models.Category.type == models.TransactionType.expense
+        ).all()
+    ]
+
+    month_labels, category_ids, totals, to_date_totals = zip(*rows)
+    category_ids = np.array(category_ids, dtype=np.int64)
+    # "YYYY-MM" -> yıl * 12 + ay - 1
+    month_keys = np.array(month_labels, dtype="datetime64[M]").astype(np.int64) + 1970 * 12
+    return (
+        month_keys,
+        category_ids,
+        np.array(totals, dtype=np.float64),
+        np.array(to_date_totals, dtype=np.float64),
+        np.isin(category_ids, expense_category_ids)
+    )
+
+
+def _empty_insights(today: date, window: int):
+    days_in_month = calendar.monthrange(today.year, today.month)[1]
+    return {
+        "window": window,
+        "months": [],
+        "anomalies": [],
+        "forecast": {
+            "spent_so_far": 0.0,
+            "projected_expense": 0.0,
+            "days_elapsed": today.day,
+            "days_in_month": days_in_month
+        }
+    }
+
+
+def compute_insights(db: Session, user_id: int, today: date = None, window: int = 3):
+    """Aylık seriler, anomaliler ve ay sonu tahminini hesapla"""
+    if today is None:
+        today = date.today()
+
+    columns = _load_columns(db, user_id, today.day)
+    if columns is None:
+        return _empty_insights(today, window)
+    month_keys, category_ids, amounts, to_date_amounts, is_expense = columns
+
+    # Ay indeksleri: ilk işlem ayından bu aya kadar
+    current_key = today.year * 12 + today.month - 1
+    first_key = min(int(month_keys.min()), current_key)
+    n_months = current_key - first_key + 1
+    month_idx = month_keys - first_key
+
+    # Gelecek tarihli işlemler seri dışında kalır
+    in_range = month_idx < n_months
+    month_idx = month_idx[in_range]
+    amounts = amounts[in_range]
+    to_date_amounts = to_date_amounts[in_range]
+    category_ids = category_ids[in_range]
+    is_expense = is_expense[in_range]
+
+    expense_amounts = np.where(is_expense, amounts, 0.0)
+    income_amounts = np.where(is_expense, 0.0, amounts)
+    monthly_expense = np.bincount(month_idx, weights=expense_amounts, minlength=n_months)
+    monthly_income = np.bincount(month_idx, weights=income_amounts, minlength=n_months)
+    # Her ayın bugünkü güne kadarki (ilk today.day gün) gideri
+    monthly_expense_to_date = np.bincount(
+        month_idx, weights=np.where(is_expense, to_date_amounts, 0.0), minlength=n_months
+    )
+
+    # Hareketli ortalama (ilk aylarda mevcut ay sayısı kadar)
+    cumulative = np.concatenate(([0.0], np.cumsum(monthly_expense)))
+    upper = np.arange(1, n_months + 1)
+    lower = np.maximum(upper - window, 0)
+    rolling_avg = (cumulative[upper] - cumulative[lower]) / (upper - lower)
+
+    # Aylık değişim
+    previous = np.concatenate(([np.nan], monthly_expense[:-1]))
+    change = monthly_expense - previous
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change_pct = np.where(previous > 0, change / previous * 100, np.nan)
+
+    # Kategori x ay gider matrisi; yalnızca her ayın ilk today.day günü sayılır, böylece
+    # yarım kalan bu ay geçmiş ayların aynı dönemiyle karşılaştırılır
+    categories, cat_idx = np.unique(category_ids[is_expense], return_inverse=True)
+    anomalies = []
+    if categories.size and n_months > 1:
+        expense_month_idx = month_idx[is_expense]
+        matrix = np.bincount(
+            cat_idx * n_months + expense_month_idx,
+            weights=to_date_amounts[is_expense],
+            minlength=categories.size * n_months
+        ).reshape(categories.size, n_months)
+
+        # Kategorinin ilk kullanıldığı aydan önceki aylar sıfır olarak sayılmaz
+        first_use = np.full(categories.size, n_months)
+        np.minimum.at(first_use, cat_idx, expense_month_idx)
+        history = matrix[:, :-1]
+        observed = np.arange(n_months - 1) >= first_use[:, None]
+        history_months = observed.sum(axis=1)
+
+        current = matrix[:, -1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = np.where(observed, history, 0.0).sum(axis=1) / history_months
+            std = np.sqrt(
+                np.where(observed, (history - mean[:, None]) ** 2, 0.0).sum(axis=1) / history_months
+            )
+            scored = (history_months >= ANOMALY_MIN_HISTORY_MONTHS) & (std > 0)
+            z_scores = np.where(scored, (current - mean) / std, 0.0)
+
+        flagged = np.flatnonzero(np.abs(z_scores) >= ANOMALY_Z_THRESHOLD)
+        if flagged.size:
+            names = dict(db.query(models.Category.id, models.Category.name).filter(
+                models.Category.id.in_(categories[flagged].tolist())
+            ).all())
+            order = flagged[np.argsort(-np.abs(z_scores[flagged]))]
+            anomalies = [
+                {
+                    "category_id": int(categories[i]),
+                    "category_name": names.get(int(categories[i]), ""),
+                    "current": round(float(current[i]), 2),
+                    "mean": round(float(mean[i]), 2),
+                    "z_score": round(float(z_scores[i]), 2)
+                }
+                for i in order
+            ]
+
+    # Ay sonu tahmini: bu ayın harcaması + son `window` tamamlanmış ayda bugünden sonra
+    # harcananların ortalaması. Kira gibi ay başında ödenen sabit giderler geçmiş
+    # aylarda da ilk günlerde kaldığı için ayın geri kalanına yansıtılmaz
+    days_in_month = calendar.monthrange(today.year, today.month)[1]
+    spent_so_far = float(monthly_expense[-1])
+    completed = n_months - 1
+    if completed:
+        recent = slice(max(completed - window, 0), completed)
+        remaining = monthly_expense[recent] - monthly_expense_to_date[recent]
+        projected = spent_so_far + float(remaining.mean())
+    else:
+        # Geçmiş ay yoksa günlük harcama hızı kullanılır
+        projected = spent_so_far / today.day * days_in_month
+
+    first_month = np.datetime64(f"{first_key // 12:04d}-{first_key % 12 + 1:02d}", "M")
+    month_labels = np.datetime_as_string(first_month + np.arange(n_months), unit="M")
+    series = np.column_stack((
+        monthly_income, monthly_expense, rolling_avg, change, change_pct
+    )).round(2)
+
+    return {
+        "window": window,
+        "months": [
+            {
+                "month": label,
+                "income": income,
+                "expense": expense,
+                "rolling_expense_avg": avg,
+                "expense_change": None if np.isnan(delta) else delta,
+                "expense_change_pct": None if np.isnan(pct) else pct
+            }
+            for label, (income, expense, avg, delta, pct) in zip(month_labels.tolist(), series.tolist())
+        ],
+        "anomalies": anomalies,
+        "forecast": {
+            "spent_so_far": round(spent_so_far, 2),
+            "projected_expense": round(projected, 2),
+            "days_elapsed": today.day,
+            "days_in_month": days_in_month
+        }
+    }
+
+
+def get_insights(db: Session, user_id: int, window: int = 3):
+    """Önbellekten döndür; yoksa veya süresi dolmuşsa yeniden hesapla"""
+    today = date.today()
+    key = (today, window)
+    now = time.monotonic()
+
+    value, generation = insights_cache.lookup(user_id, key)
+    if value is not None:
+        return value
+
+    value = compute_insights(db, user_id, today=today, window=window)
+    insights_cache.store(user_id, key, generation, now, value)
+    return value
@@ -0,0 +1,40 @@
+"""Kullanıcı analizleri için süreç içi önbellek.
+
+Yazma yapan uçlar ve zamanlayıcı yalnızca invalidate çağırır; NumPy'ı yükleyen
+insights modülünü içe aktarmaları gerekmez, böylece worker'lar NumPy'ı ilk analiz
+isteğinde yükler.
+"""
+import threading
+import time
+
+# Diğer worker'lardaki yazmalar bu süre sonunda görünür hale gelir
+INSIGHTS_CACHE_TTL_SECONDS = 60
+
+_cache = {}
+_generations = {}  # Her yazmada artar; hesaplama sırasında gelen yazmalar önbelleğe girmez
+_cache_lock = threading.Lock()
+
+
+def invalidate(*user_ids):
+    """Kullanıcıların önbelleğe alınmış analizlerini sil"""
+    with _cache_lock:
+        for user_id in user_ids:
+            _cache.pop(user_id, None)
+            _generations[user_id] = _generations.get(user_id, 0) + 1
+
+
+def lookup(user_id: int, key):
+    """(geçerli önbellek değeri veya None, kullanıcının yazma sayacı) döner"""
+    with _cache_lock:
+        entry = _cache.get(user_id)
+        generation = _generations.get(user_id, 0)
+    if entry and entry["key"] == key and time.monotonic() - entry["computed_at"] < INSIGHTS_CACHE_TTL_SECONDS:
+        return entry["value"], generation
+    return None, generation
+
+
+def store(user_id: int, key, generation: int, computed_at: float, value):
+    """Hesaplama başladığından beri yazma olmadıysa sonucu önbelleğe al"""
+    with _cache_lock:
+        if _generations.get(user_id, 0) == generation:
+            _cache[user_id] = {"key": key, "computed_at": computed_at, "value": value}
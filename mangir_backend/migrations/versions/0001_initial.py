@@ -0,0 +1,65 @@
+"""İlk şema: kullanıcılar, kategoriler, işlemler
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("full_name", sa.String(length=100), nullable=False),
+        sa.Column("password_hash", sa.String(length=255), nullable=False),
+        sa.Column("profile_image", sa.String(length=500), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "categories",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column("type", sa.Enum("income", "expense", name="transactiontype"), nullable=False),
+        sa.Column("icon", sa.String(length=50), nullable=True),
+        sa.Column("color", sa.String(length=7), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_categories_id", "categories", ["id"])
+
+    op.create_table(
+        "transactions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("category_id", sa.Integer(), nullable=False),
+        sa.Column("amount", sa.Float(), nullable=False),
+        sa.Column("description", sa.String(length=255), nullable=True),
+        sa.Column("transaction_date", sa.DateTime(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["category_id"], ["categories.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_transactions_id", "transactions", ["id"])
+
+
+def downgrade():
+    op.drop_index("ix_transactions_id", table_name="transactions")
+    op.drop_table("transactions")
+    op.drop_index("ix_categories_id", table_name="categories")
+    op.drop_table("categories")
+    op.drop_index("ix_users_email", table_name="users")
+    op.drop_index("ix_users_id", table_name="users")
+    op.drop_table("users")
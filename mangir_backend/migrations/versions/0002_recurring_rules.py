@@ -0,0 +1,56 @@
+"""Tekrarlayan işlem kuralları ve zamanlayıcı kilidi
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "recurring_rules",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("category_id", sa.Integer(), nullable=False),
+        sa.Column("amount", sa.Float(), nullable=False),
+        sa.Column("description", sa.String(length=255), nullable=True),
+        sa.Column("frequency", sa.Enum("daily", "weekly", "monthly", "yearly", name="recurrencefrequency"), nullable=False),
+        sa.Column("interval", sa.Integer(), nullable=False),
+        sa.Column("start_date", sa.DateTime(), nullable=False),
+        sa.Column("end_date", sa.DateTime(), nullable=True),
+        sa.Column("next_run_date", sa.DateTime(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["category_id"], ["categories.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_recurring_rules_id", "recurring_rules", ["id"])
+    op.create_index("ix_recurring_rules_user_id", "recurring_rules", ["user_id"])
+    op.create_index("ix_recurring_rules_next_run_date", "recurring_rules", ["next_run_date"])
+    op.create_index("ix_recurring_rules_is_active", "recurring_rules", ["is_active"])
+
+    op.create_table(
+        "scheduler_leases",
+        sa.Column("name", sa.String(length=50), nullable=False),
+        sa.Column("owner", sa.String(length=100), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade():
+    op.drop_table("scheduler_leases")
+    op.drop_index("ix_recurring_rules_is_active", table_name="recurring_rules")
+    op.drop_index("ix_recurring_rules_next_run_date", table_name="recurring_rules")
+    op.drop_index("ix_recurring_rules_user_id", table_name="recurring_rules")
+    op.drop_index("ix_recurring_rules_id", table_name="recurring_rules")
+    op.drop_table("recurring_rules")
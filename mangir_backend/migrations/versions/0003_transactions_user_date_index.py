@@ -0,0 +1,21 @@
+"""İşlemlerde (user_id, transaction_date) indeksi
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+"""
+from alembic import op
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_transactions_user_id_transaction_date", "transactions", ["user_id", "transaction_date", "category_id", "amount"])
+
+
+def downgrade():
+    op.drop_index("ix_transactions_user_id_transaction_date", table_name="transactions")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Date, ForeignKey, Enum, DateTime
+from sqlalchemy import Column, Integer, String, Float, Date, ForeignKey, Enum, DateTime, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -8,6 +8,12 @@ class TransactionType(enum.Enum):
     income = "income"
     expense = "expense"
 
+class RecurrenceFrequency(enum.Enum):
+    daily = "daily"
+    weekly = "weekly"
+    monthly = "monthly"
+    yearly = "yearly"
+
 class User(Base):
     __tablename__ = "users"
     
@@ -19,6 +25,7 @@ class User(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     
     transactions = relationship("Transaction", back_populates="user")
+    recurring_rules = relationship("RecurringRule", back_populates="user")
 
 class Category(Base):
     __tablename__ = "categories"
@@ -43,4 +50,37 @@ class Transaction(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     
     user = relationship("User", back_populates="transactions")
-    category = relationship("Category", back_populates="transactions")
\ No newline at end of file
+    category = relationship("Category", back_populates="transactions")
+    
+    # Kullanıcı bazlı listeleme ve istatistik sorguları için; category_id ve amount
+    # da indekste olduğundan analiz sorgusu tabloya hiç gitmez
+    __table_args__ = (
+        Index("ix_transactions_user_id_transaction_date", "user_id", "transaction_date", "category_id", "amount"),
+    )
+
+class RecurringRule(Base):
+    __tablename__ = "recurring_rules"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
+    amount = Column(Float, nullable=False)
+    description = Column(String(255))
+    frequency = Column(Enum(RecurrenceFrequency), nullable=False)
+    interval = Column(Integer, nullable=False, default=1)  # Her N günde/haftada/ayda/yılda bir
+    start_date = Column(DateTime, nullable=False)  # Ay sonu tekrarlarında gün bu tarihten alınır
+    end_date = Column(DateTime, nullable=True)
+    next_run_date = Column(DateTime, nullable=False, index=True)  # Bir sonraki oluşturulacak işlem tarihi
+    is_active = Column(Boolean, nullable=False, default=True, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    user = relationship("User", back_populates="recurring_rules")
+    category = relationship("Category")
+
+class SchedulerLease(Base):
+    """Birden fazla worker arasında arka plan işlerinin kilidi"""
+    __tablename__ = "scheduler_leases"
+    
+    name = Column(String(50), primary_key=True)
+    owner = Column(String(100), nullable=False)
+    expires_at = Column(DateTime, nullable=False)
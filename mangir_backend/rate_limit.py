@@ -0,0 +1,267 @@
+"""Kimlik doğrulama uçları için token bucket hız sınırlayıcı (ASGI middleware).
+
+İstekler IP ve email anahtarlarıyla sınırlanır; reddedilen istekler veritabanına
+veya bcrypt'e ulaşmadan 429 ile döner. Tek worker için bellek içi, çok worker
+için Redis arka ucu kullanılabilir:
+
+    RATE_LIMIT_BACKEND=memory          # varsayılan
+    RATE_LIMIT_BACKEND=redis
+    REDIS_URL=redis://localhost:6379/0
+"""
+import json
+import math
+import os
+import threading
+import time
+
+from dotenv import load_dotenv
+from starlette.datastructures import QueryParams
+from starlette.requests import Request
+
+load_dotenv()
+
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")
+RATE_LIMIT_TRUST_PROXY = os.getenv("RATE_LIMIT_TRUST_PROXY", "false").lower() == "true"
+# Uygulamanın önündeki güvenilen proxy sayısı (X-Forwarded-For'a girdi ekleyenler)
+RATE_LIMIT_PROXY_HOPS = max(1, int(os.getenv("RATE_LIMIT_PROXY_HOPS", 1)))
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+# Email limiti olan rotalarda bundan büyük gövdeler 413 ile reddedilir
+MAX_BODY_SIZE = 4096
+
+
+class Limit:
+    """capacity kadar ani istek, ardından per_seconds içinde capacity istek"""
+
+    def __init__(self, capacity: int, per_seconds: float):
+        self.capacity = capacity
+        self.refill_rate = capacity / per_seconds
+
+
+# Rota bazlı politikalar: (metot, yol) -> {"ip": Limit, "email": Limit, "email_from": kaynak}
+# email_from, endpoint'in emaili okuduğu yerle aynı olmalı ("form:username", "query:email")
+POLICIES = {
+    ("POST", "/api/auth/login"): {
+        "ip": Limit(20, 60),
+        "email": Limit(5, 60),
+        "email_from": "form:username",
+    },
+    ("POST", "/api/auth/register"): {
+        "ip": Limit(5, 60),
+    },
+    ("POST", "/api/auth/forgot-password"): {
+        "ip": Limit(5, 60),
+        "email": Limit(3, 15 * 60),
+        "email_from": "query:email",
+    },
+    ("POST", "/api/auth/reset-password"): {
+        "ip": Limit(10, 60),
+        "email": Limit(5, 15 * 60),
+        "email_from": "query:email",
+    },
+}
+
+# Email bulunamayan istekler rota başına tek, ortak ve sıkı bir kovaya yazılır
+MISSING_EMAIL_LIMIT = Limit(5, 60)
+
+
+class MemoryBackend:
+    """Tek süreç içinde geçerli bellek içi token bucket"""
+
+    def __init__(self, max_keys: int = 100000):
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self._max_keys = max_keys
+
+    def _prune(self, now: float):
+        # Tamamen dolmuş kovalar varsayılan durumla aynıdır; silinebilir
+        for key, (tokens, updated_at, capacity, refill_rate) in list(self._buckets.items()):
+            if tokens + (now - updated_at) * refill_rate >= capacity:
+                del self._buckets[key]
+
+    async def take(self, key: str, limit: Limit):
+        """Bir token harca; (izin, bekleme süresi saniye) döner"""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self._max_keys:
+                    self._prune(now)
+                tokens = limit.capacity
+            else:
+                tokens, updated_at = bucket[0], bucket[1]
+                tokens = min(limit.capacity, tokens + (now - updated_at) * limit.refill_rate)
+
+            if tokens >= 1:
+                self._buckets[key] = (tokens - 1, now, limit.capacity, limit.refill_rate)
+                return True, 0
+            self._buckets[key] = (tokens, now, limit.capacity, limit.refill_rate)
+            return False, (1 - tokens) / limit.refill_rate
+
+
+class RedisBackend:
+    """Tüm worker'lar arasında paylaşılan Redis token bucket"""
+
+    # Okuma-hesaplama-yazma atomik olsun diye Lua betiği
+    SCRIPT = """
+    local capacity = tonumber(ARGV[1])
+    local refill_rate = tonumber(ARGV[2])
+    local now = tonumber(ARGV[3])
+    local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+    local tokens = tonumber(bucket[1])
+    if tokens == nil then
+        tokens = capacity
+    else
+        tokens = math.min(capacity, tokens + (now - tonumber(bucket[2])) * refill_rate)
+    end
+    local allowed = 0
+    if tokens >= 1 then
+        tokens = tokens - 1
+        allowed = 1
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated_at', now)
+    redis.call('EXPIRE', KEYS[1], math.ceil(capacity / refill_rate) + 1)
+    return {allowed, tostring(tokens)}
+    """
+
+    def __init__(self, url: str = REDIS_URL):
+        try:
+            import redis.asyncio as redis
+        except ImportError:
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis için 'redis' paketi gerekli")
+        self._client = redis.from_url(url)
+        self._script = self._client.register_script(self.SCRIPT)
+
+    async def take(self, key: str, limit: Limit):
+        allowed, tokens = await self._script(
+            keys=[f"ratelimit:{key}"],
+            args=[limit.capacity, limit.refill_rate, time.time()]
+        )
+        if allowed:
+            return True, 0
+        return False, (1 - float(tokens)) / limit.refill_rate
+
+
+def get_backend():
+    if RATE_LIMIT_BACKEND == "redis":
+        return RedisBackend()
+    return MemoryBackend()
+
+
+class RateLimitMiddleware:
+    """Politikası olan rotalarda IP ve email anahtarlarıyla istekleri sınırla"""
+
+    def __init__(self, app, backend=None, policies=POLICIES):
+        self.app = app
+        self.backend = backend or get_backend()
+        self.policies = policies
+
+    def _client_ip(self, scope) -> str:
+        if RATE_LIMIT_TRUST_PROXY:
+            # Soldaki girdileri istemci yazabilir; her güvenilen proxy sağa bir girdi
+            # ekler, bu yüzden sağdan RATE_LIMIT_PROXY_HOPS'uncu girdi kullanılır
+            forwarded = [
+                ip.strip()
+                for name, value in scope.get("headers", [])
+                if name == b"x-forwarded-for"
+                for ip in value.decode("latin-1").split(",")
+                if ip.strip()
+            ]
+            if len(forwarded) >= RATE_LIMIT_PROXY_HOPS:
+                return forwarded[-RATE_LIMIT_PROXY_HOPS]
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+    async def _read_body(self, receive):
+        """Gövdeyi MAX_BODY_SIZE'a kadar oku.
+
+        (gövde, çok büyük mü) döner; istemci bağlantıyı keserse gövde None olur.
+        """
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return None, False
+            chunks.append(message.get("body", b""))
+            size += len(chunks[-1])
+            if size > MAX_BODY_SIZE:
+                return None, True
+            if not message.get("more_body", False):
+                return b"".join(chunks), False
+
+    async def _extract_email(self, scope, body: bytes, source: str):
+        """Emaili endpoint'in okuduğu yerden, FastAPI ile aynı ayrıştırıcıyla oku"""
+        kind, field = source.split(":")
+        if kind == "query":
+            value = QueryParams(scope.get("query_string", b"")).get(field)
+        else:
+            async def body_receive():
+                return {"type": "http.request", "body": body, "more_body": False}
+
+            # urlencoded ve multipart/form-data gövdeler python-multipart ile ayrıştırılır
+            try:
+                form = await Request(scope, body_receive).form()
+            except Exception:
+                return None
+            value = form.get(field)
+            await form.close()
+
+        if not isinstance(value, str) or not value.strip():
+            return None
+        return value.strip().lower()
+
+    async def _reject(self, send, retry_after: float, status: int = 429, detail: str = "Çok fazla istek, lütfen daha sonra tekrar deneyin"):
+        body = json.dumps({"detail": detail}).encode()
+        headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ]
+        if status == 429:
+            headers.append((b"retry-after", str(max(1, math.ceil(retry_after))).encode()))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        policy = self.policies.get((scope["method"], scope["path"]))
+        if policy is None:
+            return await self.app(scope, receive, send)
+
+        route = scope["path"]
+        if "ip" in policy:
+            allowed, retry_after = await self.backend.take(f"{route}:ip:{self._client_ip(scope)}", policy["ip"])
+            if not allowed:
+                return await self._reject(send, retry_after)
+
+        if "email" not in policy:
+            return await self.app(scope, receive, send)
+
+        # Gövde okunduktan sonra uygulamaya aynen tekrar verilir
+        body, too_large = await self._read_body(receive)
+        if too_large:
+            return await self._reject(send, 0, status=413, detail="İstek gövdesi çok büyük")
+        if body is None:
+            return
+
+        email = await self._extract_email(scope, body, policy["email_from"])
+        if email:
+            allowed, retry_after = await self.backend.take(f"{route}:email:{email}", policy["email"])
+        else:
+            allowed, retry_after = await self.backend.take(f"{route}:email-missing", MISSING_EMAIL_LIMIT)
+        if not allowed:
+            return await self._reject(send, retry_after)
+
+        replayed = False
+
+        async def replay_receive():
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        await self.app(scope, replay_receive, send)
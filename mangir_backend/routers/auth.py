@@ -0,0 +1,190 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.orm import Session
+from datetime import datetime, timedelta
+import models
+import schemas
+import secrets
+import threading
+import auth
+from database import get_db
+
+router = APIRouter()
+
+# ============================================
+# AUTH ENDPOINTS
+# ============================================
+
+@router.post("/api/auth/register", response_model=schemas.UserResponse, status_code=status.HTTP_201_CREATED)
+def register(user: schemas.UserCreate, db: Session = Depends(get_db)):
+    """Yeni kullanıcı kaydı"""
+    # Email kontrolü
+    db_user = db.query(models.User).filter(models.User.email == user.email).first()
+    if db_user:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Bu email zaten kayıtlı"
+        )
+    
+    # Şifreyi hashle
+    hashed_password = auth.get_password_hash(user.password)
+    
+    # Yeni kullanıcı oluştur
+    new_user = models.User(
+        email=user.email,
+        full_name=user.full_name,
+        password_hash=hashed_password
+    )
+    
+    db.add(new_user)
+    db.commit()
+    db.refresh(new_user)
+    
+    return new_user
+
+@router.post("/api/auth/login", response_model=schemas.Token)
+def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+    """Kullanıcı girişi - Access ve Refresh token döner"""
+    # Kullanıcıyı bul
+    user = db.query(models.User).filter(models.User.email == form_data.username).first()
+    
+    if not user or not auth.verify_password(form_data.password, user.password_hash):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Email veya şifre hatalı",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    # Access ve Refresh token oluştur
+    access_token = auth.create_access_token(data={"sub": user.email})
+    refresh_token = auth.create_refresh_token(data={"sub": user.email})
+    
+    return {
+        "access_token": access_token,
+        "refresh_token": refresh_token,
+        "token_type": "bearer"
+    }
+
+@router.post("/api/auth/refresh", response_model=schemas.Token)
+def refresh_token(
+    token_data: schemas.TokenRefresh,
+    db: Session = Depends(get_db)
+):
+    """Refresh token ile yeni access token al"""
+    # Refresh token'ı doğrula
+    user = auth.verify_refresh_token(token_data.refresh_token, db)
+    
+    # Yeni tokenlar oluştur
+    new_access_token = auth.create_access_token(data={"sub": user.email})
+    new_refresh_token = auth.create_refresh_token(data={"sub": user.email})
+    
+    return {
+        "access_token": new_access_token,
+        "refresh_token": new_refresh_token,
+        "token_type": "bearer"
+    }
+
+@router.get("/api/auth/me", response_model=schemas.UserResponse)
+def get_current_user_info(current_user: models.User = Depends(auth.get_current_user)):
+    """Mevcut kullanıcı bilgilerini getir"""
+    return current_user
+
+@router.put("/api/auth/profile", response_model=schemas.UserResponse)
+def update_profile(
+    user_update: schemas.UserUpdate,
+    current_user: models.User = Depends(auth.get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Kullanıcı profil bilgilerini güncelle"""
+    current_user.full_name = user_update.full_name
+    if user_update.profile_image: current_user.profile_image = user_update.profile_image
+    db.commit()
+    db.refresh(current_user)
+    return current_user
+
+@router.put("/api/auth/change-password")
+def change_password(
+    password_data: schemas.PasswordChange,
+    current_user: models.User = Depends(auth.get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Kullanıcı şifresini değiştir"""
+    # Mevcut şifreyi doğrula
+    if not auth.verify_password(password_data.current_password, current_user.password_hash):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Mevcut şifre hatalı"
+        )
+    
+    # Yeni şifreyi hashle ve kaydet
+    current_user.password_hash = auth.get_password_hash(password_data.new_password)
+    db.commit()
+    
+    return {"message": "Şifre başarıyla değiştirildi"}
+
+password_reset_tokens = {}
+MAX_RESET_ATTEMPTS = 5
+# Endpoint'ler threadpool'da çalışır; deneme sayacı bu kilitle güncellenir
+password_reset_lock = threading.Lock()
+
+@router.post("/api/auth/forgot-password")
+def forgot_password(email: str, db: Session = Depends(get_db)):
+    """Şifre sıfırlama token'ı oluştur"""
+    user = db.query(models.User).filter(models.User.email == email).first()
+    
+    if not user:
+        # Güvenlik için her zaman başarılı mesaj dön
+        return {"message": "Eğer bu email kayıtlıysa, sıfırlama linki gönderildi"}
+    
+    # Token oluştur (6 haneli kod)
+    reset_code = f"{secrets.randbelow(10**6):06d}"
+    password_reset_tokens[email] = {
+        "code": reset_code,
+        "expires": datetime.utcnow() + timedelta(minutes=15),
+        "attempts": 0
+    }
+    
+    # Email gönderme (şimdilik console'a yazdır)
+    print(f"Şifre sıfırlama kodu: {reset_code}")
+    
+    return {"message": "Sıfırlama kodu gönderildi"}
+
+@router.post("/api/auth/reset-password")
+def reset_password(
+    email: str,
+    reset_code: str,
+    new_password: str,
+    db: Session = Depends(get_db)
+):
+    """Şifreyi sıfırla"""
+    # Token kontrolü
+    if email not in password_reset_tokens:
+        raise HTTPException(status_code=400, detail="Geçersiz veya süresi dolmuş kod")
+    
+    token_data = password_reset_tokens[email]
+    
+    if token_data["expires"] < datetime.utcnow():
+        password_reset_tokens.pop(email, None)
+        raise HTTPException(status_code=400, detail="Kod süresi dolmuş")
+    
+    # bytes: compare_digest ASCII dışı str ile TypeError verir
+    if not secrets.compare_digest(token_data["code"].encode(), reset_code.encode()):
+        # Kaba kuvvet denemelerine karşı kod belirli sayıda hatadan sonra geçersiz olur
+        with password_reset_lock:
+            token_data["attempts"] += 1
+            if token_data["attempts"] >= MAX_RESET_ATTEMPTS:
+                password_reset_tokens.pop(email, None)
+        raise HTTPException(status_code=400, detail="Hatalı kod")
+    
+    # Kullanıcıyı bul ve şifreyi değiştir
+    user = db.query(models.User).filter(models.User.email == email).first()
+    if not user:
+        raise HTTPException(status_code=404, detail="Kullanıcı bulunamadı")
+    
+    user.password_hash = auth.get_password_hash(new_password)
+    db.commit()
+    
+    # Token'ı sil
+    password_reset_tokens.pop(email, None)
+    
+    return {"message": "Şifre başarıyla sıfırlandı"}
@@ -0,0 +1,46 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from typing import List
+import models
+import schemas
+from database import get_db
+
+router = APIRouter()
+
+# ============================================
+# CATEGORY ENDPOINTS
+# ============================================
+
+@router.get("/api/categories", response_model=List[schemas.CategoryResponse])
+def get_categories(db: Session = Depends(get_db)):
+    """Tüm kategorileri getir"""
+    categories = db.query(models.Category).all()
+    return categories
+
+@router.post("/api/categories/seed")
+def seed_categories(db: Session = Depends(get_db)):
+    """Varsayılan kategorileri ekle (ilk kurulum için)"""
+    # Zaten var mı kontrol et
+    existing = db.query(models.Category).first()
+    if existing:
+        return {"message": "Kategoriler zaten mevcut"}
+    
+    default_categories = [
+        {"name": "Maaş", "type": models.TransactionType.income, "icon": "💰", "color": "#4CAF50"},
+        {"name": "Yemek", "type": models.TransactionType.expense, "icon": "🍔", "color": "#FF5722"},
+        {"name": "Ulaşım", "type": models.TransactionType.expense, "icon": "🚗", "color": "#2196F3"},
+        {"name": "Eğlence", "type": models.TransactionType.expense, "icon": "🎮", "color": "#9C27B0"},
+        {"name": "Faturalar", "type": models.TransactionType.expense, "icon": "💡", "color": "#FF9800"},
+        {"name": "Sağlık", "type": models.TransactionType.expense, "icon": "🏥", "color": "#E91E63"},
+        {"name": "Alışveriş", "type": models.TransactionType.expense, "icon": "🛒", "color": "#00BCD4"},
+        {"name": "Kira", "type": models.TransactionType.expense, "icon": "🏠", "color": "#795548"},
+        {"name": "Diğer Gelir", "type": models.TransactionType.income, "icon": "💵", "color": "#8BC34A"},
+        {"name": "Diğer Gider", "type": models.TransactionType.expense, "icon": "📦", "color": "#607D8B"},
+    ]
+    
+    for cat_data in default_categories:
+        category = models.Category(**cat_data)
+        db.add(category)
+    
+    db.commit()
+    return {"message": "Kategoriler başarıyla eklendi", "count": len(default_categories)}
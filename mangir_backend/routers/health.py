@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Request, Response, status
+from datetime import datetime
+
+router = APIRouter()
+
+# Root endpoint
+@router.get("/")
+def read_root():
+    return {"message": "Mangır API - Çalışıyor!", "version": "1.0.0"}
+
+# ============================================
+# HEALTH CHECK
+# ============================================
+
+@router.get("/health")
+def health_check():
+    """API sağlık kontrolü"""
+    return {"status": "healthy", "timestamp": datetime.utcnow()}
+
+@router.get("/ready")
+def readiness_check(request: Request, response: Response):
+    """Hazırlık kontrolü: veritabanı bağlantı havuzu ısınana kadar 503 döner"""
+    if not request.app.state.ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "starting", "timestamp": datetime.utcnow()}
+    return {"status": "ready", "timestamp": datetime.utcnow()}
@@ -0,0 +1,98 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import joinedload
+from typing import List
+import models
+import schemas
+import auth
+from database import get_db
+
+router = APIRouter()
+
+# ============================================
+# RECURRING RULE ENDPOINTS
+# ============================================
+
+@router.post("/api/recurring", response_model=schemas.RecurringRuleResponse, status_code=status.HTTP_201_CREATED)
+def create_recurring_rule(
+    rule: schemas.RecurringRuleCreate,
+    current_user: models.User = Depends(auth.get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Tekrarlayan işlem kuralı ekle (kira, maaş vb.)"""
+    category = db.query(models.Category).filter(models.Category.id == rule.category_id).first()
+    if not category:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Kategori bulunamadı"
+        )
+    
+    if rule.frequency not in models.RecurrenceFrequency.__members__:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Geçersiz tekrar sıklığı"
+        )
+    
+    if rule.interval < 1:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Tekrar aralığı en az 1 olmalı"
+        )
+    
+    new_rule = models.RecurringRule(
+        user_id=current_user.id,
+        category_id=rule.category_id,
+        amount=rule.amount,
+        description=rule.description,
+        frequency=models.RecurrenceFrequency[rule.frequency],
+        interval=rule.interval,
+        start_date=rule.start_date,
+        end_date=rule.end_date,
+        next_run_date=rule.start_date,
+        is_active=True
+    )
+    
+    db.add(new_rule)
+    db.commit()
+    db.refresh(new_rule)
+    
+    return new_rule
+
+@router.get("/api/recurring", response_model=List[schemas.RecurringRuleResponse])
+def get_recurring_rules(
+    current_user: models.User = Depends(auth.get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Kullanıcının tekrarlayan işlem kurallarını getir"""
+    rules = db.query(models.RecurringRule).options(
+        joinedload(models.RecurringRule.category)
+    ).filter(
+        models.RecurringRule.user_id == current_user.id
+    ).order_by(
+        models.RecurringRule.next_run_date
+    ).all()
+    
+    return rules
+
+@router.delete("/api/recurring/{rule_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_recurring_rule(
+    rule_id: int,
+    current_user: models.User = Depends(auth.get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Tekrarlayan işlem kuralını sil (oluşturulmuş işlemler silinmez)"""
+    rule = db.query(models.RecurringRule).filter(
+        models.RecurringRule.id == rule_id,
+        models.RecurringRule.user_id == current_user.id
+    ).first()
+    
+    if not rule:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Kural bulunamadı"
+        )
+    
+    db.delete(rule)
+    db.commit()
+    
+    return None
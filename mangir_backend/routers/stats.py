@@ -0,0 +1,202 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from sqlalchemy import func, extract
+from datetime import datetime, date, timedelta
+import models
+import schemas
+import auth
+from database import get_db
+
+router = APIRouter()
+
+# ============================================
+# STATISTICS ENDPOINTS
+# ============================================
+
+@router.get("/api/stats/period", response_model=schemas.MonthlyStats)
+def get_period_stats(
+    period: str = "monthly",  # weekly, monthly, yearly
+    year: int = None,
+    month: int = None,
+    week_start: str = None,
+    current_user: models.User = Depends(auth.get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Dönemsel istatistikler (haftalık, aylık, yıllık)"""
+    today = date.today()
+    
+    if period == "weekly":
+        # Takvimsel hafta
+        if week_start:
+            start_date = datetime.strptime(week_start, '%Y-%m-%d').date()
+        else:
+            today_weekday = today.weekday()
+            start_date = today - timedelta(days=today_weekday)
+        
+        end_date = start_date + timedelta(days=6)
+        
+        start_datetime = datetime.combine(start_date, datetime.min.time())
+        end_datetime = datetime.combine(end_date, datetime.max.time())
+
+        income = db.query(func.sum(models.Transaction.amount)).join(
+            models.Category
+        ).filter(
+            models.Transaction.user_id == current_user.id,
+            models.Category.type == models.TransactionType.income,
+            models.Transaction.transaction_date >= start_datetime,  
+            models.Transaction.transaction_date <= end_datetime      
+        ).scalar() or 0.0
+        
+        expense = db.query(func.sum(models.Transaction.amount)).join(
+            models.Category
+        ).filter(
+            models.Transaction.user_id == current_user.id,
+            models.Category.type == models.TransactionType.expense,
+            models.Transaction.transaction_date >= start_datetime,  
+            models.Transaction.transaction_date <= end_datetime      
+        ).scalar() or 0.0
+        
+    elif period == "yearly":
+        # Yıllık
+        if not year:
+            year = today.year
+        
+        income = db.query(func.sum(models.Transaction.amount)).join(
+            models.Category
+        ).filter(
+            models.Transaction.user_id == current_user.id,
+            models.Category.type == models.TransactionType.income,
+            extract('year', models.Transaction.transaction_date) == year
+        ).scalar() or 0.0
+        
+        expense = db.query(func.sum(models.Transaction.amount)).join(
+            models.Category
+        ).filter(
+            models.Transaction.user_id == current_user.id,
+            models.Category.type == models.TransactionType.expense,
+            extract('year', models.Transaction.transaction_date) == year
+        ).scalar() or 0.0
+        
+    else:  # monthly (varsayılan)
+        if not year or not month:
+            year = today.year
+            month = today.month
+        
+        income = db.query(func.sum(models.Transaction.amount)).join(
+            models.Category
+        ).filter(
+            models.Transaction.user_id == current_user.id,
+            models.Category.type == models.TransactionType.income,
+            extract('year', models.Transaction.transaction_date) == year,
+            extract('month', models.Transaction.transaction_date) == month
+        ).scalar() or 0.0
+        
+        expense = db.query(func.sum(models.Transaction.amount)).join(
+            models.Category
+        ).filter(
+            models.Transaction.user_id == current_user.id,
+            models.Category.type == models.TransactionType.expense,
+            extract('year', models.Transaction.transaction_date) == year,
+            extract('month', models.Transaction.transaction_date) == month
+        ).scalar() or 0.0
+    
+    balance = income - expense
+    
+    return {
+        "income": float(income),
+        "expense": float(expense),
+        "balance": float(balance)
+    }
+
+
+@router.get("/api/stats/by-category-period")
+def get_stats_by_category_period(
+    period: str = "monthly",
+    year: int = None,
+    month: int = None,
+    week_start: str = None,
+    current_user: models.User = Depends(auth.get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Dönemsel kategori istatistikleri"""
+    today = date.today()
+    
+    query = db.query(
+        models.Category.id,
+        models.Category.name,
+        models.Category.icon,
+        models.Category.color,
+        func.sum(models.Transaction.amount).label('total')
+    ).join(
+        models.Transaction
+    ).filter(
+        models.Transaction.user_id == current_user.id
+    )
+    
+    if period == "weekly":
+        # Takvimsel hafta
+        if week_start:
+            start_date = datetime.strptime(week_start, '%Y-%m-%d').date()
+        else:
+            today_weekday = today.weekday()
+            start_date = today - timedelta(days=today_weekday)
+        
+        end_date = start_date + timedelta(days=6)
+        
+        
+        start_datetime = datetime.combine(start_date, datetime.min.time())
+        end_datetime = datetime.combine(end_date, datetime.max.time())
+        
+        query = query.filter(
+            models.Transaction.transaction_date >= start_datetime,  
+            models.Transaction.transaction_date <= end_datetime      
+        )
+    elif period == "yearly":
+        if not year:
+            year = today.year
+        query = query.filter(
+            extract('year', models.Transaction.transaction_date) == year
+        )
+    else:  # monthly
+        if not year or not month:
+            year = today.year
+            month = today.month
+        query = query.filter(
+            extract('year', models.Transaction.transaction_date) == year,
+            extract('month', models.Transaction.transaction_date) == month
+        )
+    
+    results = query.group_by(models.Category.id).all()
+    
+    total_amount = sum([r.total for r in results])
+    
+    category_stats = []
+    for r in results:
+        percentage = (r.total / total_amount * 100) if total_amount > 0 else 0
+        category_stats.append({
+            "category_id": r.id,
+            "category_name": r.name,
+            "icon": r.icon,
+            "color": r.color,
+            "total": float(r.total),
+            "percentage": round(percentage, 2)
+        })
+    
+    return category_stats
+
+@router.get("/api/stats/insights", response_model=schemas.Insights)
+def get_insights(
+    window: int = 3,
+    current_user: models.User = Depends(auth.get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Harcama analizleri: hareketli ortalama, aylık değişim, anomaliler ve ay sonu tahmini"""
+    if window < 1:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Pencere en az 1 ay olmalı"
+        )
+    
+    # NumPy yalnızca ilk analiz isteğinde yüklenir; worker başlangıcını yavaşlatmaz
+    import insights
+    return insights.get_insights(db, current_user.id, window=window)
@@ -0,0 +1,211 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from sqlalchemy import extract
+from sqlalchemy.orm import joinedload
+from typing import List
+import models
+import schemas
+import auth
+import insights_cache
+from database import get_db
+
+router = APIRouter()
+
+# ============================================
+# TRANSACTION ENDPOINTS
+# ============================================
+
+@router.post("/api/transactions", response_model=schemas.TransactionResponse, status_code=status.HTTP_201_CREATED)
+def create_transaction(
+    transaction: schemas.TransactionCreate,
+    current_user: models.User = Depends(auth.get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Yeni işlem ekle"""
+    # Kategori var mı kontrol et
+    category = db.query(models.Category).filter(models.Category.id == transaction.category_id).first()
+    if not category:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Kategori bulunamadı"
+        )
+    
+    new_transaction = models.Transaction(
+        user_id=current_user.id,
+        category_id=transaction.category_id,
+        amount=transaction.amount,
+        description=transaction.description,
+        transaction_date=transaction.transaction_date
+    )
+    
+    db.add(new_transaction)
+    db.commit()
+    db.refresh(new_transaction)
+    insights_cache.invalidate(current_user.id)
+    
+    return new_transaction
+
+# fields= ile seçilebilen işlem sütunları
+TRANSACTION_FIELDS = ["id", "user_id", "category_id", "amount", "description", "transaction_date", "created_at"]
+
+@router.get("/api/transactions", response_model=List[schemas.TransactionListItem], response_model_exclude_unset=True)
+def get_transactions(
+    skip: int = 0,
+    limit: int = 100,
+    year: int = None,
+    month: int = None,
+    fields: str = None,  # Örn: id,amount,transaction_date
+    category: str = "full",  # full: kategori nesnesi, id: yalnızca category_id
+    current_user: models.User = Depends(auth.get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Kullanıcının tüm işlemlerini getir"""
+    if category not in ("full", "id"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="category parametresi 'full' veya 'id' olmalı"
+        )
+    
+    if fields:
+        selected = [f.strip() for f in fields.split(",") if f.strip()]
+        invalid = [f for f in selected if f not in TRANSACTION_FIELDS]
+        if invalid:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Geçersiz alan: {', '.join(invalid)}"
+            )
+    else:
+        selected = list(TRANSACTION_FIELDS)
+    
+    if category == "id" and "category_id" not in selected:
+        selected.append("category_id")
+    
+    # Tam yanıt: ORM nesneleri ve kategori ilişkisi
+    if not fields and category == "full":
+        query = db.query(models.Transaction).options(
+            joinedload(models.Transaction.category)
+        )
+    # Kısmi yanıt: yalnızca seçilen sütunlar SQL'de okunur
+    else:
+        columns = [getattr(models.Transaction, f) for f in selected]
+        if category == "full":
+            columns += [
+                models.Category.id.label("category__id"),
+                models.Category.name.label("category__name"),
+                models.Category.type.label("category__type"),
+                models.Category.icon.label("category__icon"),
+                models.Category.color.label("category__color")
+            ]
+            query = db.query(*columns).join(models.Category)
+        else:
+            query = db.query(*columns)
+    
+    query = query.filter(
+        models.Transaction.user_id == current_user.id
+    )
+    
+    # Ay filtresi varsa ekle
+    if year and month:
+        query = query.filter(
+            extract('year', models.Transaction.transaction_date) == year,
+            extract('month', models.Transaction.transaction_date) == month
+        )
+    
+    transactions = query.order_by(
+        models.Transaction.transaction_date.desc()
+    ).offset(skip).limit(limit).all()
+    
+    if not fields and category == "full":
+        return transactions
+    
+    if category == "id":
+        return [dict(zip(selected, row)) for row in transactions]
+    
+    n = len(selected)
+    return [
+        {
+            **dict(zip(selected, row[:n])),
+            "category": {
+                "id": row[n],
+                "name": row[n + 1],
+                "type": row[n + 2].value,
+                "icon": row[n + 3],
+                "color": row[n + 4]
+            }
+        }
+        for row in transactions
+    ]
+
+@router.get("/api/transactions/{transaction_id}", response_model=schemas.TransactionResponse)
+def get_transaction(
+    transaction_id: int,
+    current_user: models.User = Depends(auth.get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Tek bir işlemi getir"""
+    transaction = db.query(models.Transaction).filter(
+        models.Transaction.id == transaction_id,
+        models.Transaction.user_id == current_user.id
+    ).first()
+    
+    if not transaction:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="İşlem bulunamadı"
+        )
+    
+    return transaction
+
+@router.put("/api/transactions/{transaction_id}", response_model=schemas.TransactionResponse)
+def update_transaction(
+    transaction_id: int,
+    transaction_update: schemas.TransactionCreate,
+    current_user: models.User = Depends(auth.get_current_user),
+    db: Session = Depends(get_db)
+):
+    """İşlemi güncelle"""
+    transaction = db.query(models.Transaction).filter(
+        models.Transaction.id == transaction_id,
+        models.Transaction.user_id == current_user.id
+    ).first()
+    
+    if not transaction:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="İşlem bulunamadı"
+        )
+    
+    transaction.category_id = transaction_update.category_id
+    transaction.amount = transaction_update.amount
+    transaction.description = transaction_update.description
+    transaction.transaction_date = transaction_update.transaction_date
+    
+    db.commit()
+    db.refresh(transaction)
+    insights_cache.invalidate(current_user.id)
+    
+    return transaction
+
+@router.delete("/api/transactions/{transaction_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_transaction(
+    transaction_id: int,
+    current_user: models.User = Depends(auth.get_current_user),
+    db: Session = Depends(get_db)
+):
+    """İşlemi sil"""
+    transaction = db.query(models.Transaction).filter(
+        models.Transaction.id == transaction_id,
+        models.Transaction.user_id == current_user.id
+    ).first()
+    
+    if not transaction:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="İşlem bulunamadı"
+        )
+    
+    db.delete(transaction)
+    db.commit()
+    insights_cache.invalidate(current_user.id)
+    
+    return None
@@ -0,0 +1,237 @@
+"""Tekrarlayan işlemleri (kira, maaş vb.) arka planda oluşturan zamanlayıcı.
+
+FastAPI lifespan içinde çalışır ya da ayrı bir worker olarak başlatılabilir:
+
+    python scheduler.py
+"""
+import asyncio
+import calendar
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from dotenv import load_dotenv
+from sqlalchemy import case, insert, or_, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+import insights_cache
+import models
+from database import SessionLocal
+
+load_dotenv()
+
+RECURRING_SCHEDULER_ENABLED = os.getenv("RECURRING_SCHEDULER_ENABLED", "true").lower() == "true"
+RECURRING_INTERVAL_SECONDS = int(os.getenv("RECURRING_INTERVAL_SECONDS", 300))
+RECURRING_BATCH_SIZE = int(os.getenv("RECURRING_BATCH_SIZE", 500))
+# Uzun kesintilerden sonra tek bir kural için en fazla bu kadar işlem oluşturulur
+RECURRING_MAX_CATCHUP = int(os.getenv("RECURRING_MAX_CATCHUP", 366))
+
+LEASE_NAME = "recurring_materializer"
+LEASE_TTL = timedelta(seconds=max(RECURRING_INTERVAL_SECONDS, 60))
+
+# Her süreç (uvicorn worker) için tekil kimlik
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def _add_months(value: datetime, months: int, anchor_day: int) -> datetime:
+    """Ay ekle; gün, ayın son gününü aşarsa ay sonuna sabitlenir (31 Ocak -> 28 Şubat -> 31 Mart)"""
+    month_index = value.month - 1 + months
+    year = value.year + month_index // 12
+    month = month_index % 12 + 1
+    day = min(anchor_day, calendar.monthrange(year, month)[1])
+    return value.replace(year=year, month=month, day=day)
+
+
+def next_occurrence(current: datetime, frequency: models.RecurrenceFrequency, interval: int, anchor_day: int) -> datetime:
+    """Verilen tarihten sonraki tekrar tarihini hesapla"""
+    if frequency == models.RecurrenceFrequency.daily:
+        return current + timedelta(days=interval)
+    if frequency == models.RecurrenceFrequency.weekly:
+        return current + timedelta(weeks=interval)
+    if frequency == models.RecurrenceFrequency.monthly:
+        return _add_months(current, interval, anchor_day)
+    return _add_months(current, 12 * interval, anchor_day)
+
+
+def acquire_lease(db: Session, owner: str = WORKER_ID, ttl: timedelta = LEASE_TTL) -> bool:
+    """Zamanlayıcı kilidini al veya yenile; başka bir worker tutuyorsa False döner"""
+    now = datetime.utcnow()
+    result = db.execute(
+        update(models.SchedulerLease)
+        .where(
+            models.SchedulerLease.name == LEASE_NAME,
+            or_(
+                models.SchedulerLease.expires_at < now,
+                models.SchedulerLease.owner == owner
+            )
+        )
+        .values(owner=owner, expires_at=now + ttl)
+    )
+    if result.rowcount:
+        db.commit()
+        return True
+
+    # Kilit satırı henüz yoksa oluştur; aynı anda ekleyen diğer worker IntegrityError alır
+    try:
+        db.add(models.SchedulerLease(name=LEASE_NAME, owner=owner, expires_at=now + ttl))
+        db.commit()
+        return True
+    except IntegrityError:
+        db.rollback()
+        return False
+
+
+def release_lease(db: Session, owner: str = WORKER_ID):
+    """Kilidi bırak (yalnızca sahibi bırakabilir)"""
+    db.execute(
+        update(models.SchedulerLease)
+        .where(
+            models.SchedulerLease.name == LEASE_NAME,
+            models.SchedulerLease.owner == owner
+        )
+        .values(expires_at=datetime.utcnow())
+    )
+    db.commit()
+
+
+def materialize_due(db: Session, now: datetime = None, batch_size: int = RECURRING_BATCH_SIZE) -> int:
+    """Vadesi gelmiş tüm tekrarlayan işlemleri toplu olarak oluştur.
+
+    Kurallar id sırasıyla parça parça okunur; her parça tek bir UPDATE ve tek bir
+    INSERT ile yazılır. Kilit yalnızca kaba koordinasyon içindir: UPDATE yalnızca
+    next_run_date'i okunan değerde kalan kuralları ilerletir ve parçanın tamamı
+    eşleşmezse parça geri alınıp yeniden okunur, böylece iki worker aynı tekrarı
+    asla iki kez oluşturmaz. Oluşturulan işlem sayısını döner.
+    """
+    if now is None:
+        now = datetime.utcnow()
+
+    created = 0
+    last_id = 0
+    while True:
+        rules = db.query(
+            models.RecurringRule.id,
+            models.RecurringRule.user_id,
+            models.RecurringRule.category_id,
+            models.RecurringRule.amount,
+            models.RecurringRule.description,
+            models.RecurringRule.frequency,
+            models.RecurringRule.interval,
+            models.RecurringRule.start_date,
+            models.RecurringRule.end_date,
+            models.RecurringRule.next_run_date
+        ).filter(
+            models.RecurringRule.is_active == True,
+            models.RecurringRule.next_run_date <= now,
+            models.RecurringRule.id > last_id
+        ).order_by(
+            models.RecurringRule.id
+        ).limit(batch_size).all()
+
+        if not rules:
+            break
+
+        transaction_rows = []
+        next_run_dates = {}
+        still_active = {}
+        for rule in rules:
+            run_date = rule.next_run_date
+            rule_count = 0
+            # Kesinti sonrası kaçırılan tüm tekrarları yakala
+            while run_date <= now and (rule.end_date is None or run_date <= rule.end_date) and rule_count < RECURRING_MAX_CATCHUP:
+                transaction_rows.append({
+                    "user_id": rule.user_id,
+                    "category_id": rule.category_id,
+                    "amount": rule.amount,
+                    "description": rule.description,
+                    "transaction_date": run_date,
+                    "created_at": now
+                })
+                rule_count += 1
+                run_date = next_occurrence(run_date, rule.frequency, rule.interval, rule.start_date.day)
+
+            next_run_dates[rule.id] = run_date
+            still_active[rule.id] = rule.end_date is None or run_date <= rule.end_date
+
+        # Parçanın tüm kuralları tek bir koşullu UPDATE ile ilerletilir: yalnızca
+        # next_run_date'i okunan değerde kalan satırlar eşleşir
+        result = db.execute(
+            update(models.RecurringRule)
+            .where(
+                tuple_(models.RecurringRule.id, models.RecurringRule.next_run_date).in_(
+                    [(rule.id, rule.next_run_date) for rule in rules]
+                )
+            )
+            .values(
+                next_run_date=case(next_run_dates, value=models.RecurringRule.id),
+                is_active=case(still_active, value=models.RecurringRule.id)
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != len(rules):
+            # Başka bir worker (ör. kilit süresi dolduysa) parçadaki bir kuralı
+            # ilerletmiş; parça geri alınır ve güncel haliyle yeniden okunur
+            db.rollback()
+            continue
+
+        # Kural güncellemeleri ve eklemeler aynı veritabanı işleminde
+        if transaction_rows:
+            db.execute(insert(models.Transaction), transaction_rows)
+        db.commit()
+        insights_cache.invalidate(*{row["user_id"] for row in transaction_rows})
+
+        created += len(transaction_rows)
+        last_id = rules[-1].id
+
+        if len(rules) < batch_size:
+            break
+        # Uzun süren yakalama işlemlerinde kilidin süresi dolmasın
+        if not acquire_lease(db):
+            break
+
+    return created
+
+
+def run_once() -> int:
+    """Kilidi alabilirse vadesi gelen işlemleri oluştur"""
+    db = SessionLocal()
+    try:
+        if not acquire_lease(db):
+            return 0
+        return materialize_due(db)
+    finally:
+        db.close()
+
+
+async def run_forever(interval: int = RECURRING_INTERVAL_SECONDS):
+    """FastAPI lifespan içinde çalışan döngü"""
+    while True:
+        try:
+            created = await asyncio.to_thread(run_once)
+            if created:
+                print(f"Tekrarlayan işlemler oluşturuldu: {created}")
+        except Exception as e:
+            print(f"Tekrarlayan işlem hatası: {e}")
+        await asyncio.sleep(interval)
+
+
+if __name__ == "__main__":
+    print(f"Tekrarlayan işlem worker'ı başladı ({WORKER_ID})")
+    try:
+        while True:
+            try:
+                created = run_once()
+                if created:
+                    print(f"Tekrarlayan işlemler oluşturuldu: {created}")
+            except Exception as e:
+                print(f"Tekrarlayan işlem hatası: {e}")
+            time.sleep(RECURRING_INTERVAL_SECONDS)
+    except KeyboardInterrupt:
+        db = SessionLocal()
+        try:
+            release_lease(db)
+        finally:
+            db.close()
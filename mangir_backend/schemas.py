@@ -1,6 +1,6 @@
 from pydantic import BaseModel, EmailStr
 from datetime import date, datetime
-from typing import Optional
+from typing import List, Optional
 
 # User Schemas
 class UserCreate(BaseModel):
@@ -70,8 +70,78 @@ class TransactionResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class TransactionListItem(BaseModel):
+    """Seçilen alanlara göre kısmi dönebilen liste öğesi (fields= ve category=id)"""
+    id: Optional[int] = None
+    user_id: Optional[int] = None
+    category_id: Optional[int] = None
+    amount: Optional[float] = None
+    description: Optional[str] = None
+    transaction_date: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    category: Optional[CategoryResponse] = None
+    
+    class Config:
+        from_attributes = True
+
 # Stats Schema
 class MonthlyStats(BaseModel):
     income: float
     expense: float
-    balance: float
\ No newline at end of file
+    balance: float
+
+# Insights Schemas
+class MonthlyInsight(BaseModel):
+    month: str  # YYYY-MM
+    income: float
+    expense: float
+    rolling_expense_avg: float
+    expense_change: Optional[float] = None
+    expense_change_pct: Optional[float] = None
+
+class CategoryAnomaly(BaseModel):
+    category_id: int
+    category_name: str
+    current: float
+    mean: float
+    z_score: float
+
+class SpendingForecast(BaseModel):
+    spent_so_far: float
+    projected_expense: float
+    days_elapsed: int
+    days_in_month: int
+
+class Insights(BaseModel):
+    window: int
+    months: List[MonthlyInsight]
+    anomalies: List[CategoryAnomaly]
+    forecast: SpendingForecast
+
+# Recurring Rule Schemas
+class RecurringRuleCreate(BaseModel):
+    category_id: int
+    amount: float
+    description: Optional[str] = None
+    frequency: str  # daily, weekly, monthly, yearly
+    interval: int = 1
+    start_date: datetime
+    end_date: Optional[datetime] = None
+
+class RecurringRuleResponse(BaseModel):
+    id: int
+    user_id: int
+    category_id: int
+    amount: float
+    description: Optional[str]
+    frequency: str
+    interval: int
+    start_date: datetime
+    end_date: Optional[datetime]
+    next_run_date: datetime
+    is_active: bool
+    created_at: datetime
+    category: CategoryResponse
+    
+    class Config:
+        from_attributes = True